@@ -1,18 +1,17 @@
 import dataclasses
+import operator
+from concurrent.futures import ThreadPoolExecutor
 
 from rtorrent_rpc import RTorrent
 from rtorrent_rpc.helper import parse_comment, parse_tags
 
+# creating a client doesn't connect to rtorrent, connections are opened per request.
 r = RTorrent(address="scgi://127.0.0.1:5000")
 
-print(r.system_list_methods())
-print(r.rpc.system.listMethods())
 
-# only if your rtorrent support jsonrpc!
-print(r.jsonrpc.call("system.listMethods"))
-
-
-@dataclasses.dataclass
+# fields are declared in the same order as `TORRENT_COLUMNS`,
+# so rows can be passed positionally.
+@dataclasses.dataclass(slots=True)
 class Torrent:
     name: str
     info_hash: str
@@ -20,62 +19,102 @@ class Torrent:
     tags: set[str]
     comment: str
     is_open: bool
+    size_bytes: int
     is_private: bool
+    state: int
     is_complete: bool
     is_hashing: bool
-    state: int
 
-    size_bytes: int
+
+TORRENT_COLUMNS = (
+    "d.name=",
+    "d.hash=",
+    "d.directory_base=",
+    "d.custom1=",
+    "d.custom2=",
+    "d.is_open=",
+    "d.size_bytes=",
+    "d.is_private=",
+    "d.state=",
+    "d.complete=",
+    "d.hashing=",
+)
+
+
+_torrent_columns = operator.itemgetter(*range(len(TORRENT_COLUMNS)))
+
+
+def _torrent(
+    x: list,
+    # bound as default arguments, so they are local lookups for each row
+    _cols=_torrent_columns,
+    _pt=parse_tags,
+    _pc=parse_comment,
+    _t=Torrent,
+) -> Torrent:
+    (
+        name,
+        info_hash,
+        directory_base,
+        custom1,
+        custom2,
+        is_open,
+        size_bytes,
+        is_private,
+        state,
+        is_complete,
+        is_hashing,
+    ) = _cols(x)
+    return _t(
+        name,
+        info_hash,
+        directory_base,
+        _pt(custom1),
+        _pc(custom2),
+        is_open,
+        size_bytes,
+        is_private,
+        state,
+        is_complete,
+        is_hashing,
+    )
 
 
 def get_torrents() -> dict[str, Torrent]:
-    return {
-        x[1]: Torrent(
-            name=x[0],
-            info_hash=x[1],
-            directory_base=x[2],
-            tags=parse_tags(x[3]),
-            comment=parse_comment(x[4]),
-            is_open=x[5],
-            size_bytes=x[6],
-            is_private=x[7],
-            state=x[8],
-            is_complete=x[9],
-            is_hashing=x[10],
-        )
-        for x in r.d.multicall2(
-            "",  # required by rpc, doesn't know why
-            "default",
-            "d.name=",
-            "d.hash=",
-            "d.directory_base=",
-            "d.custom1=",
-            "d.custom2=",
-            "d.is_open=",
-            "d.size_bytes=",
-            "d.is_private=",
-            "d.state=",
-            "d.complete=",
-            "d.hashing=",
-        )
-    }
-
-
-@dataclasses.dataclass(kw_only=False)
+    rows = r.d.multicall2(
+        "",  # required by rpc, doesn't know why
+        "default",
+        *TORRENT_COLUMNS,
+    )
+
+    # bind to a local, this loop runs once per torrent
+    _tr = _torrent
+
+    torrents: dict[str, Torrent] = {}
+    for row in rows:
+        torrent = _tr(row)
+        torrents[torrent.info_hash] = torrent
+    return torrents
+
+
+@dataclasses.dataclass(slots=True)
 class File:
     name: str
     size: int
 
 
+FILE_COLUMNS = ("f.path=", "f.size_bytes=")
+
+
 def get_files(info_hash: str) -> list[File]:
     """use json rpc incase there are emoji in filename"""
 
-    files = r.f.multicall(info_hash, "", "f.path=", "f.size_bytes=")
+    files = r.f.multicall(info_hash, "", *FILE_COLUMNS)
 
-    return [File(name=f[0], size=f[1]) for f in files]
+    return [File(f[0], f[1]) for f in files]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Tracker:
     info_hash: str
     index: int
@@ -83,13 +122,57 @@ class Tracker:
     url: str
 
 
+TRACKER_COLUMNS = ("t.is_enabled=", "t.url=")
+
+
 def get_trackers(info_hash: str) -> list[Tracker]:
     return [
-        Tracker(
-            info_hash=info_hash,
-            index=i,
-            enabled=x[0],
-            url=x[1],
-        )
-        for i, x in enumerate(r.t.multicall(info_hash, "", "t.is_enabled=", "t.url="))
+        Tracker(info_hash, i, x[0], x[1])
+        for i, x in enumerate(r.t.multicall(info_hash, "", *TRACKER_COLUMNS))
+    ]
+
+
+def get_files_and_trackers(
+    info_hashes: list[str], max_workers: int = 8
+) -> dict[str, tuple[list[File], list[Tracker]]]:
+    """
+    each scgi request use its own connection,
+    so requests can be sent concurrently from multiple threads.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        files = pool.map(get_files, info_hashes)
+        trackers = pool.map(get_trackers, info_hashes)
+        return dict(zip(info_hashes, zip(files, trackers)))
+
+
+# only if your rtorrent support jsonrpc!
+def get_all(
+    info_hashes: list[str],
+) -> tuple[dict[str, Torrent], dict[str, list[Tracker]], dict[str, list[File]]]:
+    """fetch torrents with their trackers and files in a single round trip"""
+    calls: list[tuple[str, list]] = [
+        ("d.multicall2", ["", "default", *TORRENT_COLUMNS])
     ]
+    for info_hash in info_hashes:
+        calls.append(("t.multicall", [info_hash, "", *TRACKER_COLUMNS]))
+        calls.append(("f.multicall", [info_hash, "", *FILE_COLUMNS]))
+
+    torrents, *rest = r.jsonrpc.batch(calls)
+
+    trackers: dict[str, list[Tracker]] = {}
+    files: dict[str, list[File]] = {}
+    for info_hash, t, f in zip(info_hashes, rest[::2], rest[1::2]):
+        trackers[info_hash] = [
+            Tracker(info_hash, i, x[0], x[1]) for i, x in enumerate(t)
+        ]
+        files[info_hash] = [File(x[0], x[1]) for x in f]
+
+    return {x[1]: _torrent(x) for x in torrents}, trackers, files
+
+
+if __name__ == "__main__":
+    print(r.system_list_methods())
+    print(r.rpc.system.listMethods())
+
+    # only if your rtorrent support jsonrpc!
+    print(r.jsonrpc.call("system.listMethods"))
@@ -2,9 +2,11 @@ from pathlib import Path
 
 from rtorrent_rpc import RTorrent
 
+SOCKET_PATH = Path(__file__).parent.joinpath("fixtures/run/rtorrent.sock")
+
 
 def test_unix_path():
-    p = Path(__file__, "../fixtures/run/rtorrent.sock").resolve()
+    p = SOCKET_PATH
 
     assert p.exists(), "please start developing container in 'e2e/fixtures' first"
 
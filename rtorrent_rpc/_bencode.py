@@ -0,0 +1,105 @@
+"""targeted lookup in bencoded torrent files
+
+used to read a single top-level value without decoding the whole torrent.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+from types import ModuleType
+
+__all__ = ["get_top_level_str"]
+
+
+class _ScanError(Exception):
+    pass
+
+
+@functools.lru_cache(None)
+def _bencode2() -> ModuleType:
+    # only needed for the fallback, don't load it on ``import rtorrent_rpc``
+    return importlib.import_module("bencode2")
+
+
+def get_top_level_str(content: bytes, key: bytes) -> bytes | None:
+    """
+    get a string value from the top-level dict of bencoded content.
+
+    Keys of a bencoded dict are sorted, so scanning stops as soon as a key
+    greater than ``key`` is found, for ``b"comment"`` that is before ``b"info"``.
+
+    fallback to a full ``bencode2.bdecode`` on non-canonical or malformed content.
+    """
+    try:
+        r = __find_value(content, key)
+        if r is None:
+            return None
+        start, end = r
+        if __str_end(content, start) != end:
+            raise _ScanError("value is not a string")
+        return content[content.index(b":", start) + 1 : end]
+    except (_ScanError, ValueError, IndexError):
+        return _bencode2().bdecode(content).get(key)
+
+
+def __find_value(content: bytes, key: bytes) -> tuple[int, int] | None:
+    """find ``(start, end)`` of the value of ``key`` in top-level dict"""
+    if content[:1] != b"d":
+        raise _ScanError
+
+    pos = 1
+    last: bytes | None = None
+    while content[pos] != 0x65:  # e
+        end = __str_end(content, pos)
+        k = content[content.index(b":", pos) + 1 : end]
+        if last is not None and k <= last:
+            raise _ScanError("dict keys are not sorted")
+        last = k
+
+        if k > key:
+            return None
+
+        value_end = __skip_value(content, end)
+
+        if k == key:
+            return end, value_end
+
+        pos = value_end
+
+    return None
+
+
+def __str_end(content: bytes, pos: int) -> int:
+    """end index of the string starts at ``pos``"""
+    colon = content.index(b":", pos)
+    size = content[pos:colon]
+    if not size.isdigit():
+        raise _ScanError
+    end = colon + 1 + int(size)
+    if end > len(content):
+        raise _ScanError
+    return end
+
+
+def __skip_value(content: bytes, pos: int) -> int:
+    """end index of the value starts at ``pos``"""
+    depth = 0
+    while True:
+        c = content[pos]
+        if c == 0x69:  # i
+            pos = content.index(b"e", pos) + 1
+        elif 0x30 <= c <= 0x39:  # 0-9
+            pos = __str_end(content, pos)
+        elif c in (0x64, 0x6C):  # d, l
+            depth += 1
+            pos += 1
+            continue
+        elif c == 0x65 and depth:  # e
+            depth -= 1
+            pos += 1
+        else:
+            raise _ScanError
+
+        if depth == 0:
+            return pos
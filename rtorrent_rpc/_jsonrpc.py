@@ -4,32 +4,37 @@
 !! This is not a general propose json-rpc client.
 """
 
+from __future__ import annotations
+
+import itertools
 import json
-import threading
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from rtorrent_rpc._transport import _ExecutorTransport
 
-from rtorrent_rpc._transport import Transport
+if TYPE_CHECKING:
+    from rtorrent_rpc._transport import AsyncTransport, Transport
 
 try:
     import orjson
 except ImportError:
     orjson = None  # type: ignore[assignment]
 
-if orjson is None:
 
-    def _decode_json(o: bytes) -> Any:
-        return json.loads(o)
+def _stdlib_encode_json(o: Any) -> bytes:
+    return json.dumps(o).encode()
 
-    def _encode_json(o: Any) -> bytes:
-        return json.dumps(o).encode()
-
-else:
 
-    def _decode_json(o: bytes) -> Any:
-        return orjson.loads(o)
+# select encoder and decoder once, so they are called directly
+_decode_json: Callable[[bytes], Any]
+_encode_json: Callable[[Any], bytes]
 
-    def _encode_json(o: Any) -> bytes:
-        return orjson.dumps(o)
+if orjson is None:
+    _decode_json = json.loads
+    _encode_json = _stdlib_encode_json
+else:
+    _decode_json = orjson.loads
+    _encode_json = orjson.dumps
 
 
 __all__ = ["JSONRpcError", "JSONRpc"]
@@ -39,9 +44,9 @@ class JSONRpcError(Exception):
     code: int
     message: str
     data: Any
-    id: int
+    id: int | None
 
-    def __init__(self, code: int, message: str, data: Any, id: int):
+    def __init__(self, code: int, message: str, data: Any, id: int | None):
         if data:
             super().__init__(code, message, data)
         else:
@@ -58,41 +63,116 @@ class JSONRpc:
     you do not need to construct it by yourself.
     """
 
-    _id: int
-    _lock: threading.Lock
+    _id: itertools.count[int]
     _transport: Transport
+    _async_transport: AsyncTransport
 
-    __slots__ = ("_id", "_lock", "_transport")
+    __slots__ = ("_async_transport", "_id", "_transport")
 
-    def __init__(self, transport: Transport):
+    def __init__(
+        self, transport: Transport, async_transport: AsyncTransport | None = None
+    ):
         self._transport = transport
+        if async_transport is None:
+            async_transport = _ExecutorTransport(transport)
+        self._async_transport = async_transport
 
-        self._id = 0
-        self._lock = threading.Lock()
+        # next() on itertools.count is atomic, no lock needed
+        self._id = itertools.count()
+
+    def _next_id(self) -> int:
+        # unlikely to have 100w concurrent request...
+        return next(self._id) % 1000000
 
     def call(self, method: str, params: Any = None) -> Any:
         """send a json-rpc call"""
-        with self._lock:
-            id = self._id
-            # unlikely to have 100w concurrent request...
-            self._id = (id + 1) % 1000000
+        id, req = self.__encode_call(method, params)
+
+        res = self._transport.request(req, "application/json")
+
+        return self.__decode_call(id, res)
+
+    async def call_async(self, method: str, params: Any = None) -> Any:
+        """send a json-rpc call in asyncio event loop.
+
+        .. code-block:: python
+
+            names = await asyncio.gather(
+                *[rt.jsonrpc.call_async("d.name", [h]) for h in info_hashes]
+            )
+        """
+        id, req = self.__encode_call(method, params)
+
+        res = await self._async_transport.request(req, "application/json")
+
+        return self.__decode_call(id, res)
+
+    def __encode_call(self, method: str, params: Any) -> tuple[int, bytes]:
+        id = self._next_id()
 
-        req = _encode_json(
+        return id, _encode_json(
             {"jsonrpc": "2.0", "id": id, "method": method, "params": params}
         )
 
-        res = self._transport.request(req, "application/json")
-
+    @staticmethod
+    def __decode_call(id: int, res: bytes) -> Any:
         data = _decode_json(res)
 
         assert data["id"] == id, "response.id doesn't match request.id"
 
         if "error" in data:
-            raise JSONRpcError(
-                data["error"]["code"],
-                data["error"]["message"],
-                data["error"].get("data"),
-                data["id"],
-            )
+            raise _error_from_response(data)
 
         return data["result"]
+
+    def batch(self, calls: Iterable[tuple[str, Any]]) -> list[Any]:
+        """send multiple json-rpc calls in a single request.
+
+        .. code-block:: python
+
+            rt.jsonrpc.batch([("d.name", [info_hash]), ("d.size_bytes", [info_hash])])
+
+        results are returned in the same order as ``calls``,
+        a :class:`JSONRpcError` is raised for the first failed call.
+        """
+        ids: list[int] = []
+        reqs: list[dict[str, Any]] = []
+        for method, params in calls:
+            id = self._next_id()
+            ids.append(id)
+            reqs.append(
+                {"jsonrpc": "2.0", "id": id, "method": method, "params": params}
+            )
+
+        if not reqs:
+            return []
+
+        res = self._transport.request(_encode_json(reqs), "application/json")
+
+        result = _decode_json(res)
+        if isinstance(result, dict):
+            # server reject whole batch (parse error, invalid request)
+            # with a single error object
+            raise _error_from_response(result)
+
+        responses = {data["id"]: data for data in result}
+
+        assert len(responses) == len(ids), "response count doesn't match request"
+
+        results = []
+        for id in ids:
+            data = responses[id]
+            if "error" in data:
+                raise _error_from_response(data)
+            results.append(data["result"])
+
+        return results
+
+
+def _error_from_response(data: dict[str, Any]) -> JSONRpcError:
+    return JSONRpcError(
+        data["error"]["code"],
+        data["error"]["message"],
+        data["error"].get("data"),
+        data.get("id"),
+    )
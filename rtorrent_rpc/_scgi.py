@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterator
+import functools
 
 __all__ = ["encode_request", "parse_response"]
 
@@ -11,27 +11,22 @@ class ProtocolError(Exception):
     pass
 
 
-def encode_request(body: bytes, content_type: str | None = None) -> Iterator[bytes]:
-    length = len(body)
-
-    header_items: list[bytes] = [
-        *(b"CONTENT_LENGTH", NULL, str(length).encode(), NULL),
-        *(b"SCGI", NULL, b"1", NULL),
-    ]
+def encode_request(body: bytes, content_type: str | None = None) -> bytes:
+    # only length of body changes between requests, format headers in one go.
+    headers = b"CONTENT_LENGTH\x00%d\x00SCGI\x001\x00" % len(body)
 
     if content_type:
-        header_items.extend((b"CONTENT_TYPE", NULL, content_type.encode(), NULL))
+        headers += __content_type_header(content_type)
+
+    return b"".join((b"%d:" % len(headers), headers, b",", body))
 
-    header_len = sum(len(c) for c in header_items)
 
-    yield str(header_len).encode()
-    yield b":"
-    yield from header_items
-    yield b","
-    yield body
+@functools.lru_cache(maxsize=8)
+def __content_type_header(content_type: str) -> bytes:
+    return b"CONTENT_TYPE" + NULL + content_type.encode() + NULL
 
 
-def parse_response(res: bytes) -> tuple[dict[str, str], bytes]:
+def parse_response(res: bytes | bytearray) -> tuple[dict[str, str], bytes]:
     """
     Args:
         res: should be full response bytes, including headers and body
@@ -45,17 +40,24 @@ def parse_response(res: bytes) -> tuple[dict[str, str], bytes]:
             "    ..."
         )
 
-    raw_header, _, body = res.partition(b"\r\n\r\n")
+    sep = res.find(b"\r\n\r\n")
+    if sep == -1:
+        sep = len(res)
+
+    # slice with memoryview, so body is copied only once from a bytearray
+    with memoryview(res) as view:
+        raw_header = bytes(view[:sep])
+        body = bytes(view[sep + 4 :])
+
     h = __parse_raw_headers(raw_header)
     assert int(h["content-length"].encode()) == len(body)
     return h, body
 
 
 def __parse_raw_headers(raw: bytes) -> dict[str, str]:
-    lines = raw.split(b"\r\n")
+    # decode once, header values may contain ":", split at the first one only.
     d = {}
-    for line in lines:
-        key, value = line.split(b":")
-        key = key.strip()
-        d[key.decode().lower()] = value.strip().decode()
+    for line in raw.decode().split("\r\n"):
+        key, _, value = line.partition(":")
+        d[key.strip().lower()] = value.strip()
     return d
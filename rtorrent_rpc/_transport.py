@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import socket
 import ssl
@@ -11,6 +12,7 @@ import certifi
 from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
 
 from rtorrent_rpc import _scgi as scgi
+from rtorrent_rpc._xmlrpc import loads as xml_loads
 
 
 class Transport(Protocol):
@@ -18,8 +20,16 @@ class Transport(Protocol):
         """encode request data and return response body"""
 
 
+class AsyncTransport(Protocol):
+    async def request(self, data: bytes, content_type: str | None = None) -> bytes:
+        """encode request data and return response body"""
+
+
 _VALIDATE_ENV_KEY = "PY_RTORRENT_RPC_DISABLE_TLS_CERT"
 
+# initial size of SCGI response buffer, doubled when it's full
+_RECV_BUFFER_SIZE = 64 * 1024
+
 
 class BadStatusError(Exception):
     status: int
@@ -32,23 +42,37 @@ class BadStatusError(Exception):
 
 
 class _SCGITransport(Transport):
+    """
+    SCGI is one request per connection, rtorrent closes the socket
+    after the response is written, so connections can't be pooled or reused here.
+
+    If connection reuse matters, put rtorrent behind a http scgi proxy (nginx)
+    and use http(s) address, :class:`_HTTPTransport` keeps connections alive.
+    """
+
     def _connect(self) -> socket.socket:
         raise NotImplementedError
 
     def request(self, body: bytes, content_type: str | None = None) -> bytes:
         with self._connect() as conn:
-            for chunk in scgi.encode_request(body, content_type):
-                conn.send(chunk)
+            conn.sendall(scgi.encode_request(body, content_type))
 
-            chunks = []
+            buf = bytearray(_RECV_BUFFER_SIZE)
+            size = 0
             while True:
-                chunk = conn.recv(4096)
-                if chunk:
-                    chunks.append(chunk)
-                else:
+                if size == len(buf):
+                    buf.extend(bytes(len(buf)))
+
+                with memoryview(buf) as view:
+                    n = conn.recv_into(view[size:])
+
+                if not n:
                     break
+                size += n
+
+        del buf[size:]
 
-        res_header, res_body = scgi.parse_response(b"".join(chunks))
+        res_header, res_body = scgi.parse_response(buf)
 
         return res_body
 
@@ -83,9 +107,95 @@ class _SCGITcpTransport(_SCGITransport):
         self.__timeout = timeout
 
     def _connect(self) -> socket.socket:
-        return socket.create_connection(
+        sock = socket.create_connection(
             (self.__host, self.__port), timeout=self.__timeout
         )
+        # request is written with a single sendall, don't let nagle hold back
+        # the last segment of a large request waiting for a delayed ack.
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+
+class _AsyncSCGITransport(AsyncTransport):
+    """
+    asyncio version of :class:`_SCGITransport`, a connection per request,
+    many requests can be in flight on a single event loop.
+
+    ``timeout`` is a deadline of the whole request (connect, write and read),
+    unlike sync transports which apply it to each socket operation.
+    """
+
+    _timeout: float | None
+
+    async def _open(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        raise NotImplementedError
+
+    async def request(self, body: bytes, content_type: str | None = None) -> bytes:
+        return await asyncio.wait_for(self.__request(body, content_type), self._timeout)
+
+    async def __request(self, body: bytes, content_type: str | None) -> bytes:
+        reader, writer = await self._open()
+        try:
+            writer.write(scgi.encode_request(body, content_type))
+            await writer.drain()
+            res = await reader.read()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+        _, res_body = scgi.parse_response(res)
+
+        return res_body
+
+
+class _AsyncSCGIUnixTransport(_AsyncSCGITransport):
+    __path: str
+
+    __slots__ = ("__path", "_timeout")
+
+    def __init__(self, path: str, timeout: float | None) -> None:
+        self.__path = path
+        self._timeout = timeout
+
+    async def _open(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.open_unix_connection(self.__path)
+
+
+class _AsyncSCGITcpTransport(_AsyncSCGITransport):
+    __host: str
+    __port: int
+
+    __slots__ = ("__host", "__port", "_timeout")
+
+    def __init__(self, host: str, port: int, timeout: float | None) -> None:
+        self.__host = host
+        self.__port = port
+        self._timeout = timeout
+
+    async def _open(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        # asyncio set TCP_NODELAY on tcp connections
+        return await asyncio.open_connection(self.__host, self.__port)
+
+
+class _ExecutorTransport(AsyncTransport):
+    """
+    run a blocking :class:`Transport` in default executor of the running loop.
+
+    Used for http(s) address, there is no async http client in dependencies,
+    urllib3 pool is thread-safe and keeps connections alive.
+    """
+
+    __transport: Transport
+
+    __slots__ = ("__transport",)
+
+    def __init__(self, transport: Transport) -> None:
+        self.__transport = transport
+
+    async def request(self, body: bytes, content_type: str | None = None) -> bytes:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.__transport.request, body, content_type
+        )
 
 
 class _HTTPTransport(Transport):
@@ -99,6 +209,9 @@ class _HTTPTransport(Transport):
         self.port = u.port
         self.u = u
 
+        # pool is bound to host and port already, only send request target.
+        self._url_path = (u.path or "/") + (f"?{u.query}" if u.query else "")
+
         if self.u.scheme == "http":
             self._pool = HTTPConnectionPool(self.host, self.port, timeout=timeout)
         elif self.u.scheme == "https":
@@ -118,9 +231,9 @@ class _HTTPTransport(Transport):
         if content_type:
             headers["content-type"] = content_type
 
-        res = self._pool.request(
+        res = self._pool.urlopen(
             method="POST",
-            url=self.address,
+            url=self._url_path,
             body=body,
             redirect=False,
             headers=headers,
@@ -148,9 +261,4 @@ class SCGIXmlTransport(xmlrpc.client.Transport):
         return self._parse_response(self._trx.request(request_body))
 
     def _parse_response(self, response_data: bytes) -> Any:
-        p, u = self.getparser()
-
-        p.feed(response_data)
-        p.close()
-
-        return u.close()
+        return xml_loads(response_data)
@@ -0,0 +1,185 @@
+"""xml-rpc request encoding and response decoding used by RTorrent"""
+
+from __future__ import annotations
+
+import base64
+import decimal
+import xml.etree.ElementTree as ET
+import xmlrpc.client
+from typing import Any, Callable
+
+__all__ = ["dumps", "loads"]
+
+
+def _dump_bytes(
+    _: xmlrpc.client.Marshaller, value: Any, write: Callable[[str], object]
+) -> None:
+    # ``base64.encodebytes`` used by stdlib loops in python for each 57 bytes line,
+    # encode torrent content with a single ``b64encode`` call instead.
+    write("<value><base64>\n")
+    write(base64.b64encode(value).decode("ascii"))
+    write("\n</base64></value>\n")
+
+
+_dispatch = dict(xmlrpc.client.Marshaller.dispatch)
+_dispatch[bytes] = _dump_bytes
+_dispatch[bytearray] = _dump_bytes
+
+
+class _Marshaller(xmlrpc.client.Marshaller):
+    dispatch = _dispatch
+
+
+class _UnsupportedTypeError(Exception):
+    pass
+
+
+def _escape(s: str) -> str:
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+# rtorrent calls nest a few levels at most, anything deeper is handed to
+# Marshaller, which also detects recursive containers.
+_MAX_DEPTH = 32
+
+
+def _dump_fast(value: Any, out: list[str], depth: int = 0) -> None:
+    """emit types rtorrent methods take, raise ``_UnsupportedTypeError`` for others"""
+    t = type(value)
+    if t is str:
+        out.append(f"<value><string>{_escape(value)}</string></value>\n")
+    elif t is int:
+        if value > xmlrpc.client.MAXINT or value < xmlrpc.client.MININT:
+            raise OverflowError("int exceeds XML-RPC limits")
+        out.append(f"<value><int>{value}</int></value>\n")
+    elif t is list or t is tuple:
+        if depth > _MAX_DEPTH:
+            raise _UnsupportedTypeError
+        out.append("<value><array><data>\n")
+        for v in value:
+            _dump_fast(v, out, depth + 1)
+        out.append("</data></array></value>\n")
+    elif t is dict:
+        if depth > _MAX_DEPTH:
+            raise _UnsupportedTypeError
+        out.append("<value><struct>\n")
+        for k, v in value.items():
+            if type(k) is not str:
+                raise _UnsupportedTypeError
+            out.append(f"<member>\n<name>{_escape(k)}</name>\n")
+            _dump_fast(v, out, depth + 1)
+            out.append("</member>\n")
+        out.append("</struct></value>\n")
+    elif t is bytes or t is bytearray:
+        out.append("<value><base64>\n")
+        out.append(base64.b64encode(value).decode("ascii"))
+        out.append("\n</base64></value>\n")
+    elif t is bool:
+        out.append(f"<value><boolean>{int(value)}</boolean></value>\n")
+    elif t is float:
+        out.append(f"<value><double>{value!r}</double></value>\n")
+    else:
+        raise _UnsupportedTypeError
+
+
+def _dump_params(params: tuple[Any, ...]) -> str:
+    out = ["<params>\n"]
+    try:
+        for v in params:
+            out.append("<param>\n")
+            _dump_fast(v, out)
+            out.append("</param>\n")
+    except _UnsupportedTypeError:
+        # other types or subclasses, let Marshaller handle them.
+        return _Marshaller("utf-8").dumps(params)
+    out.append("</params>\n")
+    return "".join(out)
+
+
+def dumps(params: tuple[Any, ...], methodname: str) -> str:
+    """same as ``xmlrpc.client.dumps(params, methodname)``"""
+    return (
+        "<?xml version='1.0'?>\n"
+        "<methodCall>\n"
+        f"<methodName>{methodname}</methodName>\n"
+        f"{_dump_params(params)}"
+        "</methodCall>\n"
+    )
+
+
+class _UnknownTagError(Exception):
+    pass
+
+
+def _local_name(tag: str) -> str:
+    # strip namespace, ``{uri}i8`` or ``ex:i8`` of apache extensions
+    return tag.rpartition("}")[2].rpartition(":")[2]
+
+
+def _load_value(value: ET.Element) -> Any:
+    if not len(value):
+        # no type element, default to string
+        return value.text or ""
+
+    e = value[0]
+    tag = _local_name(e.tag)
+    if tag in ("i8", "i4", "int", "i2", "i1", "biginteger"):
+        return int(e.text)  # type: ignore[arg-type]
+    if tag == "string":
+        return e.text or ""
+    if tag == "array":
+        data = e.find("data")
+        if data is None:
+            return []
+        return [_load_value(v) for v in data]
+    if tag == "struct":
+        d = {}
+        for m in e:
+            v = m.find("value")
+            if v is None:
+                raise _UnknownTagError
+            d[m.findtext("name", "")] = _load_value(v)
+        return d
+    if tag == "boolean":
+        if e.text == "0":
+            return False
+        if e.text == "1":
+            return True
+        raise TypeError("bad boolean value")
+    if tag in ("double", "float"):
+        return float(e.text)  # type: ignore[arg-type]
+    if tag == "nil":
+        return None
+    if tag == "base64":
+        return xmlrpc.client.Binary(base64.decodebytes((e.text or "").encode()))
+    if tag == "dateTime.iso8601":
+        return xmlrpc.client.DateTime(e.text or "")
+    if tag == "bigdecimal":
+        return decimal.Decimal(e.text or "")
+    raise _UnknownTagError
+
+
+def loads(data: bytes) -> tuple[Any, ...]:
+    """
+    decode xml-rpc response, like ``xmlrpc.client.loads(data)[0]``.
+
+    ``xmlrpc.client.Unmarshaller`` dispatch every SAX event in python,
+    response is parsed by ``ElementTree`` in C then walked here.
+    Responses ``ElementTree`` can't handle, or with unknown tags,
+    are passed to ``xmlrpc.client.loads``.
+
+    raise ``xmlrpc.client.Fault`` for fault response.
+    """
+    try:
+        root = ET.fromstring(data)
+
+        fault = root.find("fault/value")
+        if fault is not None:
+            f = _load_value(fault)
+        else:
+            return tuple(_load_value(v) for v in root.iterfind("params/param/value"))
+    except (ET.ParseError, _UnknownTagError):
+        # undeclared namespace prefix (``<ex:nil/>``), or a type we don't know
+        return xmlrpc.client.loads(data)[0]
+
+    raise xmlrpc.client.Fault(**f)
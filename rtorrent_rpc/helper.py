@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import enum
 import hashlib
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 from urllib.parse import unquote
@@ -19,30 +21,22 @@ __all__ = [
 
 
 def parse_tags(s: str) -> set[str]:
-    """ruTorrent compatibility method to parse ``d.custom1`` as tags"""
-    tags = set()
-    for t in s.split(","):
-        tt = t.strip()
-        if tt:
-            tags.add(unquote(tt))
-    return tags
+    """ruTorrent compatibility method to parse ``d.custom1`` as tags
 
+    tag strings are interned, same tag on different torrents share one str object.
+    """
+    if not s:
+        return set()
+    return {sys.intern(unquote(t)) for t in map(str.strip, s.split(",")) if t}
 
-if sys.version_info >= (3, 9):
-
-    def __remove_prefix(s: str, prefix: str) -> str:
-        return s.removeprefix(prefix)
-
-else:
 
-    def __remove_prefix(s: str, prefix: str) -> str:
-        return s[len(prefix) :]
+__comment_prefix = "VRS24mrker"
 
 
 def parse_comment(s: str) -> str:
     """ruTorrent compatibility method to parse ``d.custom2`` as torrent comment"""
-    if s.startswith("VRS24mrker"):
-        return unquote(__remove_prefix(s, "VRS24mrker"))
+    if s.startswith(__comment_prefix):
+        return unquote(s[len(__comment_prefix) :])
     return s
 
 
@@ -58,84 +52,115 @@ class LibTorrentFilePriority(enum.IntEnum):
     HIGH = 2
 
 
-def add_fast_resume_file(base_save_path: Path, torrent_content: bytes) -> bytes:
+def add_fast_resume_file(
+    base_save_path: Path, torrent_content: bytes, *, stat_workers: int = 1
+) -> bytes:
     """update torrent content, add resume data to torrent,
     skip checking file exists on disk.
 
+    Args:
+        stat_workers: number of threads to stat files of a multi-file torrent,
+            only helpful on network file systems, default is to stat them one by one.
+
     Warnings:
         this may cause rtorrent into a invalid state and causing bugs, use at your own risk.
     """
 
     return __add_resume_file(
-        base_save_path, torrent_content, LibTorrentFilePriority.NORMAL.value
+        base_save_path,
+        torrent_content,
+        LibTorrentFilePriority.NORMAL.value,
+        stat_workers,
     )
 
 
-def add_completed_resume_file(base_save_path: Path, torrent_content: bytes) -> bytes:
+def add_completed_resume_file(
+    base_save_path: Path, torrent_content: bytes, *, stat_workers: int = 1
+) -> bytes:
     """update torrent content, add resume data to torrent.
 
+    Args:
+        stat_workers: number of threads to stat files of a multi-file torrent,
+            only helpful on network file systems, default is to stat them one by one.
+
     Warnings:
         this may cause rtorrent into a invalid state and causing bugs, use at your own risk.
     """
     return __add_resume_file(
-        base_save_path, torrent_content, LibTorrentFilePriority.OFF.value
+        base_save_path, torrent_content, LibTorrentFilePriority.OFF.value, stat_workers
     )
 
 
+def __lstat(path: str) -> os.stat_result | None:
+    try:
+        return os.lstat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
 def __add_resume_file(
     base_save_path: Path,
     torrent_content: bytes,
     un_complete_file_prop: int,
+    stat_workers: int,
 ) -> bytes:
     """
     based on [rtorrent_fast_resume.pl](https://github.com/rakshasa/rtorrent/blob/master/doc/rtorrent_fast_resume.pl)
     """
     data: dict[bytes, Any] = bencode2.bdecode(torrent_content)
 
-    piece_length = data[b"info"][b"piece length"]
+    info = data[b"info"]
+    piece_length: int = info[b"piece length"]
+    piece_count = len(info[b"pieces"]) // 20
     files: list[dict[bytes, Any]] = []
 
-    t_files = data[b"info"].get(b"files")
+    t_files = info.get(b"files")
 
-    piece_count = int(len(data[b"info"][b"pieces"]) / 20)
     if t_files:
-        for file in t_files:
-            file_path = base_save_path.joinpath(*[p.decode() for p in file[b"path"]])
-            if not file_path.exists():
-                files.append(
-                    {b"complete": 0, b"mtime": 0, b"priority": un_complete_file_prop}
-                )
+        # bencode2 doesn't mutate input, share it for all uncompleted files
+        uncompleted = {b"complete": 0, b"mtime": 0, b"priority": un_complete_file_prop}
+        base = os.fspath(base_save_path)
+        paths = [os.path.join(base, *[p.decode() for p in f[b"path"]]) for f in t_files]
+
+        if stat_workers > 1:
+            # lstat may be a network round-trip on remote file system,
+            # syscall releases GIL so run them in threads.
+            # On local disk threads are much slower than a plain loop.
+            with ThreadPoolExecutor(max_workers=stat_workers) as executor:
+                stats = list(executor.map(__lstat, paths))
+        else:
+            stats = [__lstat(path) for path in paths]
+
+        for file, stat in zip(t_files, stats):
+            if stat is None:
+                files.append(uncompleted)
                 continue
 
-            stat = file_path.lstat()
             if stat.st_size != file[b"length"]:
-                files.append(
-                    {b"complete": 0, b"mtime": 0, b"priority": un_complete_file_prop}
-                )
+                files.append(uncompleted)
                 continue
 
             files.append(
                 {
-                    b"complete": int(file[b"length"] / piece_length),
+                    b"complete": file[b"length"] // piece_length,
                     b"mtime": int(stat.st_mtime),
                     b"priority": 1,
                 }
             )
     else:
         try:
-            stat = base_save_path.joinpath(data[b"info"][b"name"].decode()).lstat()
+            stat = base_save_path.joinpath(info[b"name"].decode()).lstat()
         except FileNotFoundError:
             return torrent_content
 
-        if stat.st_size == data[b"info"][b"length"]:
+        if stat.st_size == info[b"length"]:
             files.append(
                 {b"complete": piece_count, b"mtime": int(stat.st_mtime), b"priority": 1}
             )
         else:
             return torrent_content
 
-    data[b"rtorrent"] = None
-    del data[b"rtorrent"]
+    data.pop(b"rtorrent", None)
 
     data[b"libtorrent_resume"] = {b"bitfield": piece_count, b"files": files}
 
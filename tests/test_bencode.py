@@ -0,0 +1,51 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import bencode2
+import pytest
+
+from rtorrent_rpc._bencode import get_top_level_str
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {b"comment": b"hello", b"info": {b"name": b"a", b"length": 1}},
+        {
+            b"announce": b"http://example.com/announce",
+            b"announce-list": [[b"http://a"], [b"http://b"]],
+            b"comment": "中文".encode(),
+            b"creation date": 1,
+            b"info": {b"name": b"a", b"length": 1},
+        },
+        {b"created by": b"me", b"info": {b"name": b"a", b"length": 1}},
+        {b"a": {b"nested": [1, b"x", {b"d": b"e"}]}, b"comment": b"c"},
+        {},
+    ],
+)
+def test_get_top_level_str(data):
+    assert get_top_level_str(bencode2.bencode(data), b"comment") == data.get(b"comment")
+
+
+def test_get_top_level_str_invalid():
+    # unsorted keys, fallback to bencode2 and raise same error
+    with pytest.raises(bencode2.BencodeDecodeError):
+        get_top_level_str(b"d1:b1:x1:a1:y7:comment1:ce", b"comment")
+
+
+def test_get_top_level_str_torrent_file():
+    content = (
+        Path(__file__)
+        .joinpath("../fixtures/ubuntu-22.04.2-desktop-amd64.iso.torrent")
+        .resolve()
+        .read_bytes()
+    )
+    assert get_top_level_str(content, b"comment") == bencode2.bdecode(content).get(
+        b"comment"
+    )
+
+
+def test_bencode2_lazy_import():
+    code = "import sys, rtorrent_rpc; assert 'bencode2' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
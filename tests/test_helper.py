@@ -1,6 +1,16 @@
+import os
 from pathlib import Path
 
-from rtorrent_rpc.helper import get_torrent_info_hash
+import bencode2
+import pytest
+
+from rtorrent_rpc.helper import (
+    add_completed_resume_file,
+    add_fast_resume_file,
+    get_torrent_info_hash,
+    parse_comment,
+    parse_tags,
+)
 
 
 def test_get_torrent_info_hash():
@@ -11,3 +21,69 @@ def test_get_torrent_info_hash():
             get_torrent_info_hash(f.read())
             == "a7838b75c42b612da3b6cc99beed4ecb2d04cff2"
         )
+
+
+def test_parse_tags():
+    assert parse_tags("") == set()
+    assert parse_tags("a,b") == {"a", "b"}
+    assert parse_tags(" a , ,b%20c,") == {"a", "b c"}
+
+
+def test_parse_comment():
+    assert parse_comment("") == ""
+    assert parse_comment("plain%20text") == "plain%20text"
+    assert parse_comment("VRS24mrkerhello%20world") == "hello world"
+
+
+def _write(path: Path, size: int, mtime: int = 1000) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+
+
+def test_add_resume_file_single_file(tmp_path):
+    info = {b"length": 40, b"name": b"a", b"piece length": 16, b"pieces": b"0" * 60}
+    torrent = {b"announce": b"http://t", b"info": info, b"rtorrent": {b"x": 1}}
+    content = bencode2.bencode(torrent)
+
+    # missing file, return content unchanged
+    assert add_fast_resume_file(tmp_path, content) == content
+
+    _write(tmp_path / "a", 40)
+
+    assert add_fast_resume_file(tmp_path, content) == bencode2.bencode(
+        {
+            b"announce": b"http://t",
+            b"info": info,
+            b"libtorrent_resume": {
+                b"bitfield": 3,
+                b"files": [{b"complete": 3, b"mtime": 1000, b"priority": 1}],
+            },
+        }
+    )
+
+
+@pytest.mark.parametrize("stat_workers", [1, 4])
+def test_add_resume_file_multi_file(tmp_path, stat_workers):
+    count = 20
+    files = [{b"length": 40, b"path": [b"d", b"f%d" % i]} for i in range(count)]
+    info = {b"files": files, b"name": b"t", b"piece length": 16, b"pieces": b"0" * 60}
+    content = bencode2.bencode({b"info": info, b"rtorrent": {}})
+
+    # file 0 missing, file 1 has wrong size
+    _write(tmp_path / "d" / "f1", 39)
+    for i in range(2, count):
+        _write(tmp_path / "d" / f"f{i}", 40, mtime=i)
+
+    for f, priority in [(add_fast_resume_file, 1), (add_completed_resume_file, 0)]:
+        uncompleted = {b"complete": 0, b"mtime": 0, b"priority": priority}
+        expected = [uncompleted, uncompleted] + [
+            {b"complete": 2, b"mtime": i, b"priority": 1} for i in range(2, count)
+        ]
+
+        assert f(tmp_path, content, stat_workers=stat_workers) == bencode2.bencode(
+            {
+                b"info": info,
+                b"libtorrent_resume": {b"bitfield": 3, b"files": expected},
+            }
+        )
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from rtorrent_rpc import JSONRpcError
+from rtorrent_rpc._jsonrpc import JSONRpc
+
+
+class FakeTransport:
+    def __init__(self, results: dict[str, object]):
+        self.results = results
+        self.requests: list[object] = []
+
+    def _response(self, req: dict) -> dict:
+        if req["method"] not in self.results:
+            return {
+                "jsonrpc": "2.0",
+                "id": req["id"],
+                "error": {"code": -506, "message": "method not defined"},
+            }
+        return {
+            "jsonrpc": "2.0",
+            "id": req["id"],
+            "result": self.results[req["method"]],
+        }
+
+    def request(self, data: bytes, content_type: str | None = None) -> bytes:
+        req = json.loads(data)
+        self.requests.append(req)
+        if isinstance(req, list):
+            # responses of a batch may be returned in any order
+            return json.dumps([self._response(r) for r in reversed(req)]).encode()
+        return json.dumps(self._response(req)).encode()
+
+
+def test_call():
+    t = FakeTransport({"system.hostname": "localhost"})
+    assert JSONRpc(t).call("system.hostname") == "localhost"
+
+
+def test_call_async():
+    t = FakeTransport({"system.hostname": "localhost"})
+    rpc = JSONRpc(t)
+
+    async def main():
+        return await asyncio.gather(*[rpc.call_async("system.hostname") for _ in "abc"])
+
+    assert asyncio.run(main()) == ["localhost"] * 3
+    assert len(t.requests) == 3
+
+
+def test_batch():
+    t = FakeTransport({"d.name": "ubuntu", "d.size_bytes": 42})
+    rpc = JSONRpc(t)
+
+    assert rpc.batch([("d.name", ["hash"]), ("d.size_bytes", ["hash"])]) == [
+        "ubuntu",
+        42,
+    ]
+    assert len(t.requests) == 1
+
+
+def test_batch_empty():
+    t = FakeTransport({})
+    assert JSONRpc(t).batch([]) == []
+    assert not t.requests
+
+
+def test_batch_error():
+    t = FakeTransport({"d.name": "ubuntu"})
+    with pytest.raises(JSONRpcError) as e:
+        JSONRpc(t).batch([("d.name", ["hash"]), ("d.unknown", ["hash"])])
+
+    assert e.value.code == -506
+
+
+def test_batch_rejected():
+    class RejectTransport:
+        def request(self, data: bytes, content_type: str | None = None) -> bytes:
+            return json.dumps(
+                {
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {"code": -32600, "message": "invalid request"},
+                }
+            ).encode()
+
+    with pytest.raises(JSONRpcError) as e:
+        JSONRpc(RejectTransport()).batch([("d.name", ["hash"])])
+
+    assert e.value.code == -32600
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import xmlrpc.client
+
+import pytest
+
+from rtorrent_rpc import RTorrent
+
+
+class FakeProxy:
+    system = object()
+    d = object()
+    t = object()
+    f = object()
+
+
+def test_rpc_prefix_follow_rpc():
+    rt = RTorrent("scgi:///tmp/rtorrent.sock")
+    rt.d  # noqa: B018
+
+    proxy = FakeProxy()
+    rt.rpc = proxy  # type: ignore[assignment]
+
+    for name in ["system", "d", "t", "f"]:
+        assert getattr(rt, name) is getattr(proxy, name)
+
+
+class FakeTransport:
+    """answer ``system.multicall``, calls with unknown info hash fail"""
+
+    def __init__(self, known: set[str]):
+        self.known = known
+        # ``(methodName, params)`` of each call, one list per request
+        self.requests: list[list[tuple[str, list]]] = []
+
+    def request(self, data: bytes, content_type: str | None = None) -> bytes:
+        (calls,), method = xmlrpc.client.loads(data)
+        assert method == "system.multicall"
+        self.requests.append([(c["methodName"], c["params"]) for c in calls])
+        results: list[object] = []
+        for call in calls:
+            if call["params"][0] in self.known:
+                results.append([0])
+            else:
+                results.append(
+                    {"faultCode": -501, "faultString": "Could not find info-hash."}
+                )
+        return xmlrpc.client.dumps((results,), methodresponse=True).encode()
+
+
+@pytest.mark.parametrize("method", ["stop_torrents", "start_torrents"])
+def test_torrents_batch_fault(monkeypatch, method):
+    rt = RTorrent("scgi:///tmp/rtorrent.sock")
+    monkeypatch.setattr(rt, "_transport", FakeTransport({"a"}))
+
+    getattr(rt, method)(["a"])
+
+    with pytest.raises(xmlrpc.client.Fault) as e:
+        getattr(rt, method)(["a", "unknown"])
+    assert e.value.faultCode == -501
+
+
+def test_torrents_batch_empty(monkeypatch):
+    rt = RTorrent("scgi:///tmp/rtorrent.sock")
+    t = FakeTransport(set())
+    monkeypatch.setattr(rt, "_transport", t)
+
+    rt.stop_torrents([])
+    assert not t.requests
+
+
+@pytest.mark.parametrize("method", ["stop_torrent", "start_torrent"])
+def test_torrent_single_ignore_fault(monkeypatch, method):
+    rt = RTorrent("scgi:///tmp/rtorrent.sock")
+    t = FakeTransport(set())
+    monkeypatch.setattr(rt, "_transport", t)
+
+    getattr(rt, method)("unknown")
+    assert len(t.requests) == 1
+    assert len(t.requests[0]) == 2
+
+
+def test_d_set_many(monkeypatch):
+    rt = RTorrent("scgi:///tmp/rtorrent.sock")
+    t = FakeTransport({"a", "b"})
+    monkeypatch.setattr(rt, "_transport", t)
+
+    rt.d_set_tags_many({"a": ["x"], "b": []})
+    rt.d_set_comment_many({"a": "c 1", "b": ""})
+    assert rt.d_set_custom_many([("a", "k", "v"), ("b", "k", "w")]) == [0, 0]
+
+    assert t.requests == [
+        [("d.custom1.set", ["a", "x"]), ("d.custom1.set", ["b", ""])],
+        [
+            ("d.custom2.set", ["a", "VRS24mrkerc%201"]),
+            ("d.custom2.set", ["b", "VRS24mrker"]),
+        ],
+        [("d.custom.set", ["a", "k", "v"]), ("d.custom.set", ["b", "k", "w"])],
+    ]
+
+
+@pytest.mark.parametrize(
+    ("method", "arg"),
+    [
+        ("d_set_tags_many", {"a": ["x"], "unknown": ["x"]}),
+        ("d_set_comment_many", {"a": "c", "unknown": "c"}),
+        ("d_set_custom_many", [("a", "k", "v"), ("unknown", "k", "v")]),
+    ],
+)
+def test_d_set_many_fault(monkeypatch, method, arg):
+    rt = RTorrent("scgi:///tmp/rtorrent.sock")
+    t = FakeTransport({"a"})
+    monkeypatch.setattr(rt, "_transport", t)
+
+    with pytest.raises(xmlrpc.client.Fault) as e:
+        getattr(rt, method)(arg)
+    assert e.value.faultCode == -501
+    assert len(t.requests) == 1
+
+
+def test_d_set_many_empty(monkeypatch):
+    rt = RTorrent("scgi:///tmp/rtorrent.sock")
+    t = FakeTransport(set())
+    monkeypatch.setattr(rt, "_transport", t)
+
+    rt.d_set_tags_many({})
+    rt.d_set_comment_many({})
+    assert rt.d_set_custom_many([]) == []
+    assert not t.requests
+
+
+class ListMethodsTransport:
+    def __init__(self, methods: list[str]):
+        self.methods = methods
+        self.count = 0
+
+    def request(self, data: bytes, content_type: str | None = None) -> bytes:
+        _, method = xmlrpc.client.loads(data)
+        assert method == "system.listMethods"
+        self.count += 1
+        return xmlrpc.client.dumps((self.methods,), methodresponse=True).encode()
+
+
+def test_system_list_methods_cache(monkeypatch):
+    rt = RTorrent("scgi:///tmp/rtorrent.sock")
+    t = ListMethodsTransport(["d.name", "d.hash"])
+    monkeypatch.setattr(rt, "_transport", t)
+
+    methods = rt.system_list_methods()
+    assert methods == ["d.name", "d.hash"]
+    methods.append("d.mutated")
+
+    assert rt.system_list_methods() == ["d.name", "d.hash"]
+    assert t.count == 1
+
+    t.methods = ["d.name", "d.hash", "d.new"]
+    rt.invalidate_methods_cache()
+    assert rt.system_list_methods() == ["d.name", "d.hash", "d.new"]
+    assert t.count == 2
@@ -2,7 +2,7 @@ from rtorrent_rpc import _scgi as scgi
 
 
 def test_encode_request():
-    assert b"".join(scgi.encode_request(b"<>", "application/xml")) == (
+    assert scgi.encode_request(b"<>", "application/xml") == (
         b"53:"
         b"CONTENT_LENGTH\x002\x00"
         b"SCGI\x001\x00"
@@ -27,3 +27,11 @@ def test_parse_response():
         },
         b"42",
     )
+
+
+def test_parse_response_header_with_colon():
+    headers, body = scgi.parse_response(
+        b"Date: Mon, 01 Jan 2024 12:00:00 GMT\r\nContent-Length: 0\r\n\r\n"
+    )
+    assert headers["date"] == "Mon, 01 Jan 2024 12:00:00 GMT"
+    assert body == b""
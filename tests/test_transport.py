@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import http.server
+import socket
+import threading
+
+import pytest
+
+from rtorrent_rpc._transport import (
+    _AsyncSCGIUnixTransport,
+    _HTTPTransport,
+    _SCGIUnixTransport,
+)
+
+
+@pytest.fixture
+def scgi_server(tmp_path):
+    """a fake rtorrent scgi server, echo request body back"""
+    path = tmp_path.joinpath("rtorrent.sock").as_posix()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+
+    def serve():
+        while True:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return
+            with conn:
+                data = b""
+                while b"," not in data:
+                    data += conn.recv(4096)
+                header_len, _, rest = data.partition(b":")
+                headers = rest[: int(header_len)].split(b"\x00")
+                length = int(headers[headers.index(b"CONTENT_LENGTH") + 1])
+                body = rest[int(header_len) + 1 :]
+                while len(body) < length:
+                    body += conn.recv(4096)
+                conn.sendall(
+                    b"Status: 200 OK\r\n"
+                    + f"Content-Length: {len(body)}\r\n".encode()
+                    + b"\r\n"
+                    + body
+                )
+
+    t = threading.Thread(target=serve, daemon=True)
+    t.start()
+    yield path
+    server.close()
+
+
+@pytest.mark.parametrize("size", [0, 10, 64 * 1024, 1024 * 1024 + 3])
+def test_scgi_request(scgi_server, size):
+    t = _SCGIUnixTransport(scgi_server, timeout=5)
+    body = bytes(range(256)) * (size // 256) + b"x" * (size % 256)
+    assert t.request(body, "text/xml") == body
+
+
+@pytest.mark.parametrize("size", [0, 1024 * 1024 + 3])
+def test_async_scgi_request(scgi_server, size):
+    t = _AsyncSCGIUnixTransport(scgi_server, timeout=5)
+    bodies = [bytes([i]) * size for i in range(4)]
+
+    async def main():
+        return await asyncio.gather(*[t.request(b, "text/xml") for b in bodies])
+
+    assert asyncio.run(main()) == bodies
+
+
+def test_http_request():
+    paths = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["content-length"]))
+            paths.append(self.path)
+            self.send_response(200)
+            self.send_header("content-length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        t = _HTTPTransport(f"http://127.0.0.1:{server.server_port}/RPC2?a=1", 5)
+        assert t.request(b"hello", "text/xml") == b"hello"
+        assert paths == ["/RPC2?a=1"]
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,143 @@
+import xmlrpc.client
+
+import pytest
+
+from rtorrent_rpc import _xmlrpc
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        (),
+        ("", 1, True, 1.5, [1, "a"], {"methodName": "d.stop", "params": ["h"]}),
+        ("<&>",),
+        ([1, ("a", {"k": 2**31 - 1})], float("inf")),
+        # fallback to Marshaller
+        ([xmlrpc.client.DateTime(0), xmlrpc.client.Binary(b"a")],),
+    ],
+)
+def test_dumps_same_as_stdlib(params):
+    assert _xmlrpc.dumps(params, "d.name") == xmlrpc.client.dumps(params, "d.name")
+
+
+def test_dumps_bytes():
+    content = bytes(range(256)) * 10
+    params, method = xmlrpc.client.loads(
+        _xmlrpc.dumps(("", content), "load.raw"), use_builtin_types=True
+    )
+    assert method == "load.raw"
+    assert params == ("", content)
+
+
+def _recursive_list():
+    v: list = [1]
+    v.append([v])
+    return v
+
+
+def _recursive_dict():
+    v: dict = {}
+    v["k"] = [v]
+    return v
+
+
+@pytest.mark.parametrize("value", [_recursive_list(), _recursive_dict()])
+def test_dumps_recursive(value):
+    with pytest.raises(TypeError) as stdlib:
+        xmlrpc.client.dumps((value,), "d.name")
+    with pytest.raises(TypeError) as e:
+        _xmlrpc.dumps((value,), "d.name")
+    assert str(e.value) == str(stdlib.value)
+
+
+def _nested(depth):
+    v: list = ["a"]
+    for i in range(depth):
+        v = [v] if i % 2 else {"k": v}
+    return v
+
+
+@pytest.mark.parametrize("value", [_nested(2), _nested(100)])
+def test_dumps_nested(value):
+    v = ["a"]
+    params = (value, v, {"x": v, "y": v})  # shared but not recursive
+    assert _xmlrpc.dumps(params, "d.name") == xmlrpc.client.dumps(params, "d.name")
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        (),
+        ("", 1, -1, True, False, 1.5, None, [], {}),
+        ([["a", 1, ["b", []]]], {"x": {"y": [1]}}),
+        ("<&>", "中文", b"\x00\x01"),
+    ],
+)
+def test_loads_same_as_stdlib(params):
+    data = xmlrpc.client.dumps(
+        (list(params),), methodresponse=True, allow_none=True
+    ).encode()
+    assert _xmlrpc.loads(data) == xmlrpc.client.loads(data)[0]
+
+
+def test_loads_rtorrent_types():
+    data = (
+        b"<methodResponse><params>"
+        b"<param><value>a</value></param>"
+        b"<param><value/></param>"
+        b"<param><value><i8>1099511627776</i8></value></param>"
+        b"</params></methodResponse>"
+    )
+    assert _xmlrpc.loads(data) == xmlrpc.client.loads(data)[0]
+    assert _xmlrpc.loads(data) == ("a", "", 2**40)
+
+
+def test_loads_fault():
+    data = xmlrpc.client.dumps(xmlrpc.client.Fault(-501, "bad")).encode()
+    with pytest.raises(xmlrpc.client.Fault) as e:
+        _xmlrpc.loads(data)
+    assert e.value.faultCode == -501
+    assert e.value.faultString == "bad"
+
+
+def _response(*values: str) -> bytes:
+    params = "".join(f"<param><value>{v}</value></param>" for v in values)
+    return f"<methodResponse><params>{params}</params></methodResponse>".encode()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        # apache extensions, undeclared prefix
+        _response("<ex:i8>5</ex:i8>", "<ex:nil/>"),
+        # apache extensions, declared namespace
+        (
+            b'<methodResponse xmlns:ex="http://ws.apache.org/xmlrpc/namespaces/extensions">'
+            b"<params><param><value><ex:i8>5</ex:i8></value></param>"
+            b"<param><value><ex:nil/></value></param></params></methodResponse>"
+        ),
+        _response("<array></array>", "<array><data/></array>"),
+        _response(
+            "<i1>1</i1>",
+            "<i2>2</i2>",
+            "<biginteger>123456789012345678901</biginteger>",
+            "<float>1.5</float>",
+            "<bigdecimal>1.25</bigdecimal>",
+        ),
+    ],
+)
+def test_loads_extension_types(data):
+    assert _xmlrpc.loads(data) == xmlrpc.client.loads(data)[0]
+
+
+def test_loads_struct_member_order():
+    data = _response(
+        "<struct><member><value><i4>1</i4></value><name>a</name></member></struct>"
+    )
+    assert _xmlrpc.loads(data) == ({"a": 1},)
+
+
+def test_loads_unknown_tag():
+    # unknown types are handled by xmlrpc.client, raise the same error
+    with pytest.raises(xmlrpc.client.ResponseError):
+        _xmlrpc.loads(_response("<unknown>1</unknown>"))